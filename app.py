@@ -4,27 +4,58 @@ Flask Video Downloader API
 A RESTful API for downloading videos from various platforms
 """
 
+import heapq
+import mimetypes
 import os
 import sys
 import uuid
 import threading
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from flask import Flask, request, jsonify, send_file, abort
+from flask import Flask, Response, request, jsonify, abort
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.wsgi import wrap_file
 import logging
 from logging.handlers import RotatingFileHandler
 
+import msgspec
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import your existing VideoDownloader class
 from video_downloader import VideoDownloader
 
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson's C serializer.
+
+    Cuts jsonify cost on the polling-heavy endpoints (/api/downloads,
+    /api/status, /api/stats); falls back to Flask's default provider
+    when orjson is not installed.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
 CORS(app)
 
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
 # Configuration
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max request size
 app.config['DOWNLOADS_DIR'] = os.environ.get('DOWNLOADS_DIR', 'downloads')
@@ -32,9 +63,189 @@ app.config['TEMP_DIR'] = os.environ.get('TEMP_DIR', 'temp')
 app.config['MAX_CONCURRENT_DOWNLOADS'] = int(os.environ.get('MAX_CONCURRENT_DOWNLOADS', '3'))
 app.config['CLEANUP_INTERVAL_HOURS'] = int(os.environ.get('CLEANUP_INTERVAL_HOURS', '24'))
 
-# Global variables for tracking downloads
-active_downloads: Dict[str, Dict[str, Any]] = {}
-download_lock = threading.Lock()
+class DownloadStore:
+    """Sharded map of download ID -> record dict.
+
+    IDs hash into independent shards, each guarded by its own lock, so
+    status polls for one download never contend with writers updating
+    another. Records are plain dicts (jsonify-friendly) and are only
+    mutated through update() under the owning shard's lock.
+    """
+
+    SHARDS = 16
+
+    def __init__(self):
+        self._shards = [({}, threading.RLock()) for _ in range(self.SHARDS)]
+
+    def _shard(self, download_id: str):
+        return self._shards[hash(download_id) & (self.SHARDS - 1)]
+
+    def add(self, download_id: str, record: Dict[str, Any]):
+        records, lock = self._shard(download_id)
+        with lock:
+            records[download_id] = record
+
+    def get(self, download_id: str) -> Optional[Dict[str, Any]]:
+        records, lock = self._shard(download_id)
+        with lock:
+            return records.get(download_id)
+
+    def update(self, download_id: str, **fields) -> bool:
+        records, lock = self._shard(download_id)
+        with lock:
+            record = records.get(download_id)
+            if record is None:
+                return False
+            record.update(fields)
+            return True
+
+    def pop(self, download_id: str) -> Optional[Dict[str, Any]]:
+        records, lock = self._shard(download_id)
+        with lock:
+            return records.pop(download_id, None)
+
+    def __contains__(self, download_id: str) -> bool:
+        records, lock = self._shard(download_id)
+        with lock:
+            return download_id in records
+
+    def __len__(self) -> int:
+        return sum(len(records) for records, _ in self._shards)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Merge per-shard copies, each taken under its own lock"""
+        merged: Dict[str, Dict[str, Any]] = {}
+        for records, lock in self._shards:
+            with lock:
+                merged.update(records)
+        return merged
+
+
+class DownloadRequest(msgspec.Struct):
+    """Body of the POST endpoints, decoded straight into a typed object.
+
+    msgspec parses and validates in C, so a missing or mistyped field
+    surfaces as a DecodeError instead of hand-rolled dict checks; the
+    info/formats endpoints only read url and ignore the rest.
+    """
+    url: str
+    quality: str = 'best'
+    audio_only: bool = False
+    subtitles: Optional[List[str]] = None
+    playlist: bool = False
+    max_downloads: Optional[int] = None
+
+
+_download_request_decoder = msgspec.json.Decoder(DownloadRequest)
+
+
+def _decode_download_request() -> Tuple[Optional[DownloadRequest], Optional[Response]]:
+    """Decode the current request body into (request, error response).
+
+    On success the error is None. A missing url gets the cached
+    URL-required 400; any other validation failure (e.g. a mistyped
+    optional field) returns a 400 naming the actual problem instead of
+    misleading clients about the URL.
+    """
+    try:
+        return _download_request_decoder.decode(request.get_data(cache=False)), None
+    except msgspec.ValidationError as e:
+        detail = str(e)
+        if 'missing required field' in detail and '`url`' in detail:
+            return None, _json_error(_ERR_URL_REQUIRED, 400)
+        response = jsonify({'error': 'Invalid request body', 'detail': detail})
+        response.status_code = 400
+        return None, response
+    except msgspec.DecodeError:
+        response = jsonify({'error': 'Invalid request body', 'detail': 'malformed JSON'})
+        response.status_code = 400
+        return None, response
+
+
+# Timestamps are stored on records as time.time_ns() ints (cheap to
+# take, integer-comparable for sorting) and rendered as ISO strings
+# only when a record is serialized into a response.
+_TIMESTAMP_FIELDS = ('created_at', 'started_at', 'completed_at', 'cancelled_at')
+
+
+def _isoformat_ns(ns: int) -> str:
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+# Health probes hit at high frequency; cache the ISO timestamp at
+# second granularity so each call is a dict lookup, not a datetime
+# construction plus string format. The update race is benign - both
+# writers produce the same string for a given second.
+_coarse_ts_cache = (0, '')
+
+
+def _coarse_timestamp() -> str:
+    global _coarse_ts_cache
+    now = int(time.time())
+    cached_second, cached_iso = _coarse_ts_cache
+    if now != cached_second:
+        cached_iso = datetime.fromtimestamp(now).isoformat()
+        _coarse_ts_cache = (now, cached_iso)
+    return cached_iso
+
+
+def _serialize_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow-copy a record, rendering int timestamps as ISO strings"""
+    out = dict(record)
+    for field in _TIMESTAMP_FIELDS:
+        ts = out.get(field)
+        if isinstance(ts, int):
+            out[field] = _isoformat_ns(ts)
+    return out
+
+
+# Global state for tracking downloads
+active_downloads = DownloadStore()
+download_futures: Dict[str, Future] = {}
+futures_lock = threading.Lock()
+
+# Worker pool for background downloads
+download_executor = ThreadPoolExecutor(
+    max_workers=app.config['MAX_CONCURRENT_DOWNLOADS'],
+    thread_name_prefix='dl'
+)
+
+# Admission control: one permit per queued-or-running download, taken
+# non-blocking at submit time and released when the worker finishes or
+# a queued download is cancelled.
+concurrency_limiter = threading.BoundedSemaphore(app.config['MAX_CONCURRENT_DOWNLOADS'])
+
+
+def _dir_size(directory) -> int:
+    """Total size of all files under directory via a single scandir walk"""
+    total = 0
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return 0
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    total += _dir_size(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+    return total
+
+
+# Aggregate size of the downloads tree, maintained incrementally as
+# downloads complete and files are deleted so /api/stats never has to
+# rescan the tree per request. Seeded with one full scan at startup.
+_disk_usage_lock = threading.Lock()
+_disk_usage_bytes = _dir_size(app.config['DOWNLOADS_DIR'])
+
+
+def _adjust_disk_usage(delta: int):
+    global _disk_usage_bytes
+    with _disk_usage_lock:
+        _disk_usage_bytes = max(_disk_usage_bytes + delta, 0)
 
 # Setup logging
 if not app.debug:
@@ -56,33 +267,53 @@ Path(app.config['TEMP_DIR']).mkdir(exist_ok=True)
 
 class DownloadManager:
     """Manages download tasks and cleanup"""
-    
+
     def __init__(self):
-        self.cleanup_thread = threading.Thread(target=self._cleanup_old_files, daemon=True)
-        self.cleanup_thread.start()
-    
+        self._schedule_cleanup(0)
+
+    def _schedule_cleanup(self, delay: float):
+        """Arm a one-shot timer for the next cleanup pass"""
+        timer = threading.Timer(delay, self._cleanup_old_files)
+        timer.daemon = True
+        timer.start()
+
     def _cleanup_old_files(self):
-        """Background task to cleanup old downloaded files"""
-        while True:
-            try:
-                cleanup_time = datetime.now() - timedelta(hours=app.config['CLEANUP_INTERVAL_HOURS'])
-                downloads_dir = Path(app.config['DOWNLOADS_DIR'])
-                
-                for file_path in downloads_dir.rglob('*'):
-                    if file_path.is_file():
-                        file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                        if file_mtime < cleanup_time:
-                            try:
-                                file_path.unlink()
-                                app.logger.info(f"Cleaned up old file: {file_path}")
-                            except Exception as e:
-                                app.logger.error(f"Failed to cleanup file {file_path}: {e}")
-                
-                # Sleep for 1 hour before next cleanup
-                time.sleep(3600)
-            except Exception as e:
-                app.logger.error(f"Error in cleanup thread: {e}")
-                time.sleep(3600)
+        """Delete expired files, then sleep until the next one is due.
+
+        Walks the tree with os.fwalk and does dir_fd-relative stat and
+        unlink calls, so the kernel resolves each name against an open
+        directory fd instead of re-walking the full path per file.
+        """
+        ttl = app.config['CLEANUP_INTERVAL_HOURS'] * 3600
+        cutoff = time.time() - ttl
+        next_expiry = None
+
+        try:
+            for root, dirs, files, root_fd in os.fwalk(app.config['DOWNLOADS_DIR']):
+                for name in files:
+                    try:
+                        stat = os.stat(name, dir_fd=root_fd, follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if stat.st_mtime < cutoff:
+                        try:
+                            os.unlink(name, dir_fd=root_fd)
+                            _adjust_disk_usage(-stat.st_size)
+                            app.logger.info(f"Cleaned up old file: {os.path.join(root, name)}")
+                        except OSError as e:
+                            app.logger.error(f"Failed to cleanup file {os.path.join(root, name)}: {e}")
+                    elif next_expiry is None or stat.st_mtime + ttl < next_expiry:
+                        next_expiry = stat.st_mtime + ttl
+        except Exception as e:
+            app.logger.error(f"Error in cleanup thread: {e}")
+
+        # Wake when the oldest surviving file expires (new files can only
+        # push that deadline later); fall back to hourly when idle.
+        if next_expiry is not None:
+            delay = max(next_expiry - time.time(), 60)
+        else:
+            delay = 3600
+        self._schedule_cleanup(delay)
 
 # Initialize download manager
 download_manager = DownloadManager()
@@ -91,9 +322,14 @@ download_manager = DownloadManager()
 def download_worker(download_id: str, url: str, options: Dict[str, Any]):
     """Worker function for downloading videos in background"""
     try:
-        with download_lock:
-            active_downloads[download_id]['status'] = 'downloading'
-            active_downloads[download_id]['started_at'] = datetime.now().isoformat()
+        record = active_downloads.get(download_id)
+        if record is None or record['status'] == 'cancelled':
+            return
+        active_downloads.update(
+            download_id,
+            status='downloading',
+            started_at=time.time_ns()
+        )
         
         # Create downloader instance
         downloader = VideoDownloader(
@@ -114,39 +350,89 @@ def download_worker(download_id: str, url: str, options: Dict[str, Any]):
                 options.get('subtitles')
             )
         
-        with download_lock:
-            if success:
-                active_downloads[download_id]['status'] = 'completed'
-                active_downloads[download_id]['completed_at'] = datetime.now().isoformat()
-                
-                # List downloaded files
-                download_dir = Path(app.config['DOWNLOADS_DIR']) / download_id
-                files = [f.name for f in download_dir.iterdir() if f.is_file()]
-                active_downloads[download_id]['files'] = files
-            else:
-                active_downloads[download_id]['status'] = 'failed'
-                active_downloads[download_id]['error'] = 'Download failed'
-                
+        if success:
+            # List downloaded files; scandir answers is_file() from the
+            # directory entry instead of a stat() per file
+            download_dir = Path(app.config['DOWNLOADS_DIR']) / download_id
+            with os.scandir(download_dir) as entries:
+                files = [e.name for e in entries if e.is_file(follow_symlinks=False)]
+            _adjust_disk_usage(_dir_size(download_dir))
+            active_downloads.update(
+                download_id,
+                status='completed',
+                completed_at=time.time_ns(),
+                files=files
+            )
+        else:
+            active_downloads.update(download_id, status='failed', error='Download failed')
+
     except Exception as e:
         app.logger.error(f"Download error for {download_id}: {e}")
-        with download_lock:
-            active_downloads[download_id]['status'] = 'failed'
-            active_downloads[download_id]['error'] = str(e)
+        active_downloads.update(download_id, status='failed', error=str(e))
+    finally:
+        with futures_lock:
+            download_futures.pop(download_id, None)
+        concurrency_limiter.release()
+
+
+# Pre-serialized bodies for fixed error responses; skips building a
+# dict and running json.dumps on every 4xx/5xx (auth probes, bad URLs).
+_ERR_URL_REQUIRED = b'{"error": "URL is required"}'
+_ERR_ID_NOT_FOUND = b'{"error": "Download ID not found"}'
+_ERR_ENDPOINT_NOT_FOUND = b'{"error": "Endpoint not found"}'
+_ERR_REQUEST_TOO_LARGE = b'{"error": "Request too large"}'
+_ERR_INTERNAL = b'{"error": "Internal server error"}'
+
+
+def _json_error(body: bytes, status: int) -> Response:
+    """Build an error response from a pre-serialized JSON body.
+
+    Returns a fresh Response each time since extensions (Flask-CORS)
+    mutate response headers per request.
+    """
+    return Response(body, status=status, mimetype='application/json')
+
+
+# One VideoDownloader per thread for info/format extraction; building
+# an instance (logging setup, yt-dlp state) is too heavy to repeat on
+# every /api/info or /api/formats request.
+_downloader_tls = threading.local()
+
+
+def _temp_downloader() -> VideoDownloader:
+    downloader = getattr(_downloader_tls, 'downloader', None)
+    if downloader is None:
+        downloader = VideoDownloader(output_dir=app.config['TEMP_DIR'])
+        _downloader_tls.downloader = downloader
+    return downloader
+
+
+@app.before_request
+def reject_oversized_requests():
+    """Short-circuit oversized requests on the declared Content-Length.
+
+    Werkzeug only raises RequestEntityTooLarge once the body is
+    consumed; checking the header up front avoids buffering up to
+    MAX_CONTENT_LENGTH bytes from a misbehaving client.
+    """
+    content_length = request.content_length
+    if content_length is not None and content_length > app.config['MAX_CONTENT_LENGTH']:
+        return _json_error(_ERR_REQUEST_TOO_LARGE, 413)
 
 
 @app.errorhandler(RequestEntityTooLarge)
 def handle_file_too_large(e):
-    return jsonify({'error': 'Request too large'}), 413
+    return _json_error(_ERR_REQUEST_TOO_LARGE, 413)
 
 
 @app.errorhandler(404)
 def not_found(e):
-    return jsonify({'error': 'Endpoint not found'}), 404
+    return _json_error(_ERR_ENDPOINT_NOT_FOUND, 404)
 
 
 @app.errorhandler(500)
 def internal_error(e):
-    return jsonify({'error': 'Internal server error'}), 500
+    return _json_error(_ERR_INTERNAL, 500)
 
 
 @app.route('/api/health', methods=['GET'])
@@ -154,7 +440,7 @@ def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _coarse_timestamp(),
         'active_downloads': len(active_downloads),
         'version': '1.0.0'
     })
@@ -164,14 +450,14 @@ def health_check():
 def get_video_info():
     """Get video information without downloading"""
     try:
-        data = request.get_json()
-        if not data or 'url' not in data:
-            return jsonify({'error': 'URL is required'}), 400
-        
-        url = data['url']
+        req, decode_error = _decode_download_request()
+        if decode_error is not None:
+            return decode_error
+
+        url = req.url
         
-        # Create temporary downloader instance
-        downloader = VideoDownloader(output_dir=app.config['TEMP_DIR'])
+        # Reuse this thread's downloader instance
+        downloader = _temp_downloader()
         info = downloader.get_video_info(url)
         
         if info:
@@ -191,14 +477,14 @@ def get_video_info():
 def get_video_formats():
     """Get available video formats"""
     try:
-        data = request.get_json()
-        if not data or 'url' not in data:
-            return jsonify({'error': 'URL is required'}), 400
-        
-        url = data['url']
+        req, decode_error = _decode_download_request()
+        if decode_error is not None:
+            return decode_error
+
+        url = req.url
         
-        # Create temporary downloader instance
-        downloader = VideoDownloader(output_dir=app.config['TEMP_DIR'])
+        # Reuse this thread's downloader instance
+        downloader = _temp_downloader()
         formats = downloader.get_available_formats(url)
         
         if formats:
@@ -216,65 +502,53 @@ def get_video_formats():
 
 @app.route('/api/download', methods=['POST'])
 def start_download():
-    """Start video download and wait until finished, then return download ID and .mp4 files"""
+    """Queue a video download in the background and return its download ID"""
     try:
-        data = request.get_json()
-        if not data or 'url' not in data:
-            return jsonify({'error': 'URL is required'}), 400
+        req, decode_error = _decode_download_request()
+        if decode_error is not None:
+            return decode_error
 
-        # Check concurrent downloads limit
-        active_count = len([d for d in active_downloads.values() 
-                           if d['status'] in ['queued', 'downloading']])
-        
-        if active_count >= app.config['MAX_CONCURRENT_DOWNLOADS']:
+        # Check concurrent downloads limit (atomic, no record scan)
+        if not concurrency_limiter.acquire(blocking=False):
             return jsonify({
                 'error': f'Maximum concurrent downloads ({app.config["MAX_CONCURRENT_DOWNLOADS"]}) reached'
             }), 429
 
         # Generate unique download ID
         download_id = str(uuid.uuid4())
-        
+
         # Prepare download options
         options = {
-            'quality': data.get('quality', 'best'),
-            'audio_only': data.get('audio_only', False),
-            'subtitles': data.get('subtitles'),
-            'playlist': data.get('playlist', False),
-            'max_downloads': data.get('max_downloads')
+            'quality': req.quality,
+            'audio_only': req.audio_only,
+            'subtitles': req.subtitles,
+            'playlist': req.playlist,
+            'max_downloads': req.max_downloads
         }
 
-        # Store download info
-        with download_lock:
-            active_downloads[download_id] = {
-                'url': data['url'],
+        # Store download info and hand the work to the pool; give the
+        # permit back if submission itself fails.
+        try:
+            active_downloads.add(download_id, {
+                'url': req.url,
                 'status': 'queued',
-                'created_at': datetime.now().isoformat(),
+                'created_at': time.time_ns(),
                 'options': options,
                 'files': []
-            }
-
-        # --- Synchronous download ---
-        download_worker(download_id, data['url'], options)
-
-        # Fetch completed download info
-        download_info = active_downloads[download_id]
-        if download_info['status'] != 'completed':
-            return jsonify({
-                'success': False,
-                'download_id': download_id,
-                'status': download_info['status'],
-                'error': download_info.get('error', 'Unknown error')
-            }), 500
-
-        # Filter .mp4 files only
-        mp4_files = [f for f in download_info.get('files', []) if f.lower().endswith('.mp4')]
+            })
+            with futures_lock:
+                download_futures[download_id] = download_executor.submit(
+                    download_worker, download_id, req.url, options
+                )
+        except BaseException:
+            concurrency_limiter.release()
+            raise
 
         return jsonify({
             'success': True,
             'download_id': download_id,
-            'files': mp4_files,
-            'file_url' : f"https://testflask-ixf3.onrender.com/api/download/{download_id}/files/{mp4_files[0]}"
-        })
+            'message': 'Download started'
+        }), 202
 
     except Exception as e:
         app.logger.error(f"Download start error: {e}")
@@ -284,12 +558,13 @@ def start_download():
 @app.route('/api/status/<download_id>', methods=['GET'])
 def get_download_status(download_id):
     """Get download status"""
-    if download_id not in active_downloads:
-        return jsonify({'error': 'Download ID not found'}), 404
-    
+    record = active_downloads.get(download_id)
+    if record is None:
+        return _json_error(_ERR_ID_NOT_FOUND, 404)
+
     return jsonify({
         'success': True,
-        'download': active_downloads[download_id]
+        'download': _serialize_record(record)
     })
 
 
@@ -298,35 +573,32 @@ def list_downloads():
     """List all downloads with optional filtering"""
     status_filter = request.args.get('status')
     limit = request.args.get('limit', type=int)
-    
-    downloads = dict(active_downloads)
-    
+
+    items = active_downloads.snapshot().items()
     if status_filter:
-        downloads = {k: v for k, v in downloads.items() 
-                    if v['status'] == status_filter}
-    
-    # Sort by creation time (newest first)
-    sorted_downloads = dict(sorted(downloads.items(), 
-                                  key=lambda x: x[1]['created_at'], 
-                                  reverse=True))
-    
+        items = ((k, v) for k, v in items if v['status'] == status_filter)
+
+    # Newest first; with a limit, heapq.nlargest only tracks the top
+    # `limit` records instead of sorting the whole set
     if limit:
-        sorted_downloads = dict(list(sorted_downloads.items())[:limit])
-    
+        top = heapq.nlargest(limit, items, key=lambda kv: kv[1]['created_at'])
+    else:
+        top = sorted(items, key=lambda kv: kv[1]['created_at'], reverse=True)
+
     return jsonify({
         'success': True,
-        'downloads': sorted_downloads,
-        'total': len(sorted_downloads)
+        'downloads': {k: _serialize_record(v) for k, v in top},
+        'total': len(top)
     })
 
 
 @app.route('/api/download/<download_id>/files/<filename>', methods=['GET'])
 def download_file(download_id, filename):
     """Download a specific file"""
-    if download_id not in active_downloads:
-        return jsonify({'error': 'Download ID not found'}), 404
-    
-    download_info = active_downloads[download_id]
+    download_info = active_downloads.get(download_id)
+    if download_info is None:
+        return _json_error(_ERR_ID_NOT_FOUND, 404)
+
     if download_info['status'] != 'completed':
         return jsonify({'error': 'Download not completed'}), 400
     
@@ -334,12 +606,27 @@ def download_file(download_id, filename):
     
     if not file_path.exists():
         return jsonify({'error': 'File not found'}), 404
-    
+
     try:
-        return send_file(
-            file_path,
-            as_attachment=True,
-            download_name=filename
+        # Hand the open fd to the WSGI server's wsgi.file_wrapper with
+        # direct_passthrough so Werkzeug never iterates the body in
+        # Python and servers that support it go through sendfile(2).
+        # make_conditional adds ETag/Range handling (206 resumes) on top.
+        fh = open(file_path, 'rb')
+        stat = os.fstat(fh.fileno())
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+        response = Response(
+            wrap_file(request.environ, fh, buffer_size=65536),
+            mimetype=mimetype,
+            direct_passthrough=True
+        )
+        response.headers.set('Content-Disposition', 'attachment', filename=filename)
+        response.content_length = stat.st_size
+        response.last_modified = stat.st_mtime
+        response.set_etag(f"{stat.st_mtime_ns}-{stat.st_size}")
+        return response.make_conditional(
+            request, accept_ranges=True, complete_length=stat.st_size
         )
     except Exception as e:
         app.logger.error(f"File download error: {e}")
@@ -349,17 +636,26 @@ def download_file(download_id, filename):
 @app.route('/api/download/<download_id>/cancel', methods=['POST'])
 def cancel_download(download_id):
     """Cancel a download"""
-    if download_id not in active_downloads:
-        return jsonify({'error': 'Download ID not found'}), 404
-    
-    download_info = active_downloads[download_id]
+    download_info = active_downloads.get(download_id)
+    if download_info is None:
+        return _json_error(_ERR_ID_NOT_FOUND, 404)
+
     if download_info['status'] not in ['queued', 'downloading']:
         return jsonify({'error': 'Cannot cancel download in current state'}), 400
-    
-    with download_lock:
-        active_downloads[download_id]['status'] = 'cancelled'
-        active_downloads[download_id]['cancelled_at'] = datetime.now().isoformat()
-    
+
+    # Cancelling only works before the worker picks the task up;
+    # an in-flight yt-dlp download runs to completion regardless.
+    with futures_lock:
+        future = download_futures.pop(download_id, None)
+    if future and future.cancel():
+        # The worker will never run, so give its permit back here.
+        concurrency_limiter.release()
+    active_downloads.update(
+        download_id,
+        status='cancelled',
+        cancelled_at=time.time_ns()
+    )
+
     return jsonify({
         'success': True,
         'message': 'Download cancelled'
@@ -370,18 +666,20 @@ def cancel_download(download_id):
 def delete_download(download_id):
     """Delete a download and its files"""
     if download_id not in active_downloads:
-        return jsonify({'error': 'Download ID not found'}), 404
+        return _json_error(_ERR_ID_NOT_FOUND, 404)
     
     try:
         # Remove files
         download_dir = Path(app.config['DOWNLOADS_DIR']) / download_id
         if download_dir.exists():
             import shutil
+            _adjust_disk_usage(-_dir_size(download_dir))
             shutil.rmtree(download_dir)
         
         # Remove from active downloads
-        with download_lock:
-            del active_downloads[download_id]
+        active_downloads.pop(download_id)
+        with futures_lock:
+            download_futures.pop(download_id, None)
         
         return jsonify({
             'success': True,
@@ -404,19 +702,15 @@ def get_stats():
     }
     
     # Count by status
-    for download in active_downloads.values():
+    for download in active_downloads.snapshot().values():
         status = download['status']
         stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
         if status in ['queued', 'downloading']:
             stats['active_count'] += 1
     
-    # Calculate disk usage
-    try:
-        downloads_dir = Path(app.config['DOWNLOADS_DIR'])
-        stats['disk_usage'] = sum(f.stat().st_size for f in downloads_dir.rglob('*') if f.is_file())
-    except Exception:
-        stats['disk_usage'] = 0
-    
+    # Disk usage comes from the incrementally maintained counter
+    stats['disk_usage'] = _disk_usage_bytes
+
     return jsonify({
         'success': True,
         'stats': stats
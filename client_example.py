@@ -5,8 +5,10 @@ This file demonstrates how to use the Video Downloader API
 """
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, Optional
 
 
@@ -22,6 +24,17 @@ class VideoDownloaderClient:
         """
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
+
+        # The default adapter only keeps 10 pooled connections; batch
+        # and playlist workflows poll many downloads concurrently, so
+        # widen the pool and retry transient gateway errors.
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def health_check(self) -> Dict[str, Any]:
         """Check API health"""
@@ -166,33 +179,42 @@ class VideoDownloaderClient:
         response = self.session.get(f"{self.base_url}/api/stats")
         return response.json()
     
-    def wait_for_download(self, download_id: str, check_interval: int = 5, timeout: int = 3600) -> Dict[str, Any]:
+    def wait_for_download(self, download_id: str, check_interval: int = 10, timeout: int = 3600) -> Dict[str, Any]:
         """
         Wait for download to complete
-        
+
         Args:
             download_id: Download ID
-            check_interval: Seconds between status checks
+            check_interval: Maximum seconds between status checks
             timeout: Maximum time to wait in seconds
-            
+
         Returns:
             Final download status
         """
         start_time = time.time()
-        
+        delay = 0.25
+        last_status = None
+
         while time.time() - start_time < timeout:
             status = self.get_download_status(download_id)
-            
+
             if not status.get('success'):
                 return status
-            
+
             download_status = status['download']['status']
-            
+
             if download_status in ['completed', 'failed', 'cancelled']:
                 return status
-            
-            time.sleep(check_interval)
-        
+
+            # Poll with exponential backoff (capped at check_interval),
+            # resetting whenever the status changes so transitions are
+            # picked up quickly without hammering the server later on
+            if download_status != last_status:
+                delay = 0.25
+                last_status = download_status
+            time.sleep(delay)
+            delay = min(delay * 1.7, check_interval)
+
         return {'error': 'Download timeout'}
 
 
@@ -216,6 +238,34 @@ def example_usage():
     except Exception as e:
         print(f"   Error: {e}\n")
     
+    # 2. Get video information
+    print("2. Get Video Information:")
+    try:
+        info = client.get_video_info(video_url)
+        if info.get('success'):
+            video_info = info['info']
+            print(f"   Title: {video_info.get('title')}")
+            print(f"   Duration: {video_info.get('duration')} seconds")
+            print(f"   Uploader: {video_info.get('uploader')}\n")
+        else:
+            print(f"   Error: {info.get('error')}\n")
+    except Exception as e:
+        print(f"   Error: {e}\n")
+    
+    # 3. Get available formats
+    print("3. Get Available Formats:")
+    try:
+        formats = client.get_video_formats(video_url)
+        if formats.get('success'):
+            print(f"   Found {len(formats['formats'])} formats")
+            for fmt in formats['formats'][:3]:  # Show first 3 formats
+                print(f"   - {fmt.get('format_id')}: {fmt.get('ext')} {fmt.get('resolution')}")
+            print()
+        else:
+            print(f"   Error: {formats.get('error')}\n")
+    except Exception as e:
+        print(f"   Error: {e}\n")
+    
     # 4. Start a download
     print("4. Start Download:")
     try:
@@ -308,28 +358,36 @@ def batch_download_example():
     print("🔄 Batch Download Example\n")
     
     download_ids = []
-    
-    # Start all downloads
-    for i, url in enumerate(video_urls):
-        try:
-            print(f"Starting download {i+1}/{len(video_urls)}: {url}")
-            response = client.start_download(url, quality="720p")
-            
-            if response.get('success'):
-                download_id = response['download_id']
-                download_ids.append(download_id)
-                print(f"  Started with ID: {download_id}")
-            else:
-                print(f"  Failed: {response.get('error')}")
-        except Exception as e:
-            print(f"  Error: {e}")
-    
-    # Monitor all downloads
+
+    # Start all downloads in parallel; requests.Session is thread-safe
+    # and the widened adapter pool carries the concurrent POSTs
+    print(f"Starting {len(video_urls)} downloads...")
+    with ThreadPoolExecutor(max_workers=min(16, len(video_urls))) as executor:
+        futures = {
+            executor.submit(client.start_download, url, quality="720p"): url
+            for url in video_urls
+        }
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                response = future.result()
+                if response.get('success'):
+                    download_id = response['download_id']
+                    download_ids.append(download_id)
+                    print(f"  {url} -> {download_id}")
+                else:
+                    print(f"  {url} failed: {response.get('error')}")
+            except Exception as e:
+                print(f"  {url} error: {e}")
+    
+    # Monitor all downloads, backing off while nothing changes
     print(f"\nMonitoring {len(download_ids)} downloads...")
     completed = 0
-    
+    delay = 0.5
+
     while completed < len(download_ids):
-        time.sleep(5)
+        time.sleep(delay)
+        previous_completed = completed
         completed = 0
         
         for download_id in download_ids:
@@ -341,7 +399,8 @@ def batch_download_example():
                         completed += 1
             except Exception:
                 completed += 1
-        
+
+        delay = 0.5 if completed != previous_completed else min(delay * 1.7, 10)
         print(f"  Progress: {completed}/{len(download_ids)} completed")
     
     # Show final results
@@ -427,29 +486,3 @@ if __name__ == "__main__":
     else:
         print("Invalid choice. Running basic example...")
         example_usage()
-    
-    # 2. Get video information
-    print("2. Get Video Information:")
-    try:
-        info = client.get_video_info(video_url)
-        if info.get('success'):
-            video_info = info['info']
-            print(f"   Title: {video_info.get('title')}")
-            print(f"   Duration: {video_info.get('duration')} seconds")
-            print(f"   Uploader: {video_info.get('uploader')}\n")
-        else:
-            print(f"   Error: {info.get('error')}\n")
-    except Exception as e:
-        print(f"   Error: {e}\n")
-    
-    # 3. Get available formats
-    print("3. Get Available Formats:")
-    try:
-        formats = client.get_video_formats(video_url)
-        if formats.get('success'):
-            print(f"   Found {len(formats['formats'])} formats")
-            for fmt in formats['formats'][:3]:  # Show first 3 formats
-                print(f"   - {fmt.get('format_id')}: {fmt.get('ext')} {fmt.get('resolution')}")
-            print()
-        else:
-            print(f"   Error: {formats.get('error')}\n")
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""Gunicorn configuration for the Video Downloader API.
+
+Run with:
+    gunicorn -c gunicorn_conf.py app:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# The API is IO-bound (yt-dlp metadata fetches, sendfile responses), so
+# a threaded worker multiplexes those waits. Download state lives in
+# the process (active_downloads, the worker pool), so keep a single
+# worker process by default - with more, status polls could land on a
+# worker that never saw the download.
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', '1'))
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+
+# Downloads run on the background pool, so handlers return quickly;
+# the timeout only needs to cover metadata extraction for slow hosts.
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '120'))
+keepalive = 5
+
+errorlog = '-'
@@ -7,84 +7,335 @@ Supports YouTube, Vimeo, Twitter, Instagram, TikTok, and many other platforms
 
 import os
 import sys
+import time
+import asyncio
+import threading
+import re
+import queue
+import atexit
+import shutil
 import logging
-import argparse
-import json
+import logging.handlers
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
-import subprocess
 
 try:
-    import yt_dlp
+    import orjson
 except ImportError:
-    print("Error: yt-dlp is not installed. Please install it using:")
-    print("pip install yt-dlp")
-    sys.exit(1)
+    orjson = None
+
+
+# Scheme + non-empty host is all download_video ever checked; a compiled
+# regex answers that far cheaper than running urlparse's state machine
+# per playlist entry.
+_URL_RE = re.compile(r'^https?://([^/\s]+)', re.IGNORECASE)
+
+# The QueueListener thread that drains log records to the real
+# handlers; kept module-level so it outlives the downloader instances
+# and gets stopped (draining the queue) before interpreter shutdown.
+_log_listener = None
+
+
+@functools.lru_cache(maxsize=1)
+def _ytdlp():
+    """
+    Import and return the yt_dlp module on first use.
+
+    Importing yt-dlp loads the full extractor tree (~200ms and tens of
+    MB), so defer it until a download or extraction actually happens -
+    web workers importing this module for VideoDownloader's interface
+    no longer pay for it at startup.
+    """
+    try:
+        import yt_dlp
+    except ImportError:
+        print("Error: yt-dlp is not installed. Please install it using:")
+        print("pip install yt-dlp")
+        sys.exit(1)
+    return yt_dlp
+
+
+@functools.lru_cache(maxsize=1)
+def _orjson_infojson_pp():
+    """
+    Build the orjson-backed info-json postprocessor class.
+
+    Deferred behind a cached factory because the class must subclass
+    yt-dlp's PostProcessor, which is only available once _ytdlp() has
+    run.
+    """
+    class OrjsonInfoJsonPP(_ytdlp().postprocessor.PostProcessor):
+        """Write the .info.json with orjson instead of stdlib json.
+
+        Info dicts run to ~100KB per video; orjson serializes them
+        several times faster than the pure-Python encoder yt-dlp uses
+        for writeinfojson.
+        """
+
+        def run(self, info):
+            filename = self._downloader.prepare_filename(info, 'infojson')
+            if filename:
+                data = orjson.dumps(
+                    self._downloader.sanitize_info(info),
+                    option=orjson.OPT_INDENT_2,
+                    default=str,
+                )
+                with open(filename, 'wb') as f:
+                    f.write(data)
+            return [], info
+
+    return OrjsonInfoJsonPP
+
+
+class RateLimiter:
+    """Thread-safe leaky-bucket limiter shared by all workers, keyed by host.
+
+    Concurrent downloads against one host tend to trip server-side
+    throttling, which erases the parallelism win; pacing requests to a
+    per-host budget keeps every worker inside the host's good graces.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int = 4):
+        """
+        Args:
+            rate_per_sec: Tokens refilled per second per host; <= 0 disables
+            burst: Maximum tokens a host can accumulate
+        """
+        self.rate = rate_per_sec
+        self.burst = burst
+        self._buckets: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str) -> None:
+        """Block until a token is available for `host`."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
 
 
 class VideoDownloader:
     """Professional video downloader with comprehensive error handling and logging."""
-    
-    def __init__(self, output_dir: str = "downloads", quality: str = "best"):
+
+    # Fields projected out of yt-dlp's format dicts by get_available_formats
+    _FORMAT_KEYS = ('format_id', 'ext', 'resolution', 'filesize', 'fps',
+                    'vcodec', 'acodec')
+
+    # Info dicts run to hundreds of KB and their metadata (view counts,
+    # formats) drifts, so the extraction cache keeps only a handful of
+    # recent entries for a short window - enough to dedupe the
+    # info/formats/download calls of one operation without pinning
+    # every URL ever seen in a long-lived process.
+    _INFO_CACHE_MAX = 8
+    _INFO_CACHE_TTL = 300.0
+
+    def __init__(self, output_dir: str = "downloads", quality: str = "best",
+                 concurrent_fragments: int = 8, rate_limit: float = 0.0):
         """
         Initialize the video downloader.
-        
+
         Args:
             output_dir: Directory to save downloaded videos
             quality: Video quality preference (best, worst, or specific format)
+            concurrent_fragments: Parallel fragment fetches for HLS/DASH sources
+            rate_limit: Requests per second allowed per host (0 = unlimited)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # Resolve output paths once; per-download calls then do no
+        # pathlib work, which matters under the playlist worker fan-out.
+        self._filename_template = os.fspath(self.output_dir / "%(title)s.%(ext)s")
+        self._log_file = os.fspath(self.output_dir / "download.log")
         self.quality = quality
+        self.concurrent_fragments = concurrent_fragments
+        # url -> (expiry, info dict); bounded, see _INFO_CACHE_MAX/_TTL
+        self._info_cache: Dict[str, Any] = {}
+        self._info_lock = threading.Lock()
+        self._ydl_tls = threading.local()
+        # Gate serializing ffmpeg post-processing across playlist
+        # workers: downloads run at full width while merges/embeds take
+        # turns, so the network and the CPU stay busy without ffmpeg
+        # oversubscription.
+        self._pp_gate = threading.BoundedSemaphore(1)
+        self._pp_state = threading.local()
+        self._rate_limiter = RateLimiter(rate_limit)
         self.setup_logging()
         
     def setup_logging(self):
         """Setup logging configuration."""
-        log_file = self.output_dir / "download.log"
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        global _log_listener
+        # Emitting threads only enqueue records; a listener thread owns
+        # the file/stream handlers, so concurrent playlist workers don't
+        # serialize on the FileHandler lock. Matches basicConfig's
+        # behavior of configuring the root logger only once.
+        root = logging.getLogger()
+        if not root.handlers:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = logging.FileHandler(self._log_file)
+            file_handler.setFormatter(formatter)
+            stream_handler = logging.StreamHandler(sys.stdout)
+            stream_handler.setFormatter(formatter)
+
+            log_queue = queue.SimpleQueue()
+            _log_listener = logging.handlers.QueueListener(
+                log_queue, file_handler, stream_handler)
+            _log_listener.start()
+            # Stop (and thereby drain) the listener before
+            # logging.shutdown() closes its handlers, so the last
+            # records of a run aren't lost in the queue
+            atexit.register(_log_listener.stop)
+
+            root.setLevel(logging.INFO)
+            root.addHandler(logging.handlers.QueueHandler(log_queue))
         self.logger = logging.getLogger(__name__)
         
-    def get_video_info(self, url: str) -> Optional[Dict[str, Any]]:
+    def _get_ydl(self, profile: str, opts: Dict[str, Any]):
         """
-        Extract video information without downloading.
-        
+        Return a pooled YoutubeDL instance for an options profile.
+
+        Constructing YoutubeDL loads and compiles the full extractor
+        list, which dominates short calls; instances are cached per
+        options profile and reused. The pool lives in thread-local
+        storage because YoutubeDL is not thread-safe - each thread gets
+        its own instance per profile, so the bulk-info fan-out can use
+        this path too.
+
+        Only profiles whose opts are constant for the instance's
+        lifetime (info, enumeration) may be pooled: `opts` is consulted
+        solely on a miss, so a profile whose options vary per call
+        would silently reuse the first call's options. Download paths
+        build fresh instances for that reason.
+
+        Args:
+            profile: Stable key describing the options (e.g. 'info')
+            opts: yt-dlp options used to build the instance on a miss
+
+        Returns:
+            A reusable YoutubeDL instance owned by the calling thread
+        """
+        pool = getattr(self._ydl_tls, 'pool', None)
+        if pool is None:
+            pool = self._ydl_tls.pool = {}
+        ydl = pool.get(profile)
+        if ydl is None:
+            ydl = _ytdlp().YoutubeDL(opts)
+            pool[profile] = ydl
+        return ydl
+
+    def _peek_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached info dict for `url` if still fresh, else None.
+
+        Never touches the network; expired entries are dropped in place.
+        """
+        with self._info_lock:
+            cached = self._info_cache.get(url)
+            if cached is None:
+                return None
+            if cached[0] <= time.monotonic():
+                del self._info_cache[url]
+                return None
+            return cached[1]
+
+    def _extract_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch (or reuse) the full yt-dlp info dict for a URL.
+
+        Extraction is a full network round-trip, so results are cached
+        per instance and shared between the info, formats, and download
+        paths instead of re-extracting for each. Entries expire after
+        _INFO_CACHE_TTL seconds and at most _INFO_CACHE_MAX are kept,
+        evicting oldest-first.
+
         Args:
             url: Video URL
-            
+
         Returns:
-            Dictionary containing video information or None if failed
+            The raw info dict or None if extraction failed
         """
+        info = self._peek_info(url)
+        if info is not None:
+            return info
+
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
         }
-        
+
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return {
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'view_count': info.get('view_count', 0),
-                    'upload_date': info.get('upload_date', 'Unknown'),
-                    'formats': len(info.get('formats', [])),
-                    'thumbnail': info.get('thumbnail', ''),
-                    'description': info.get('description', '')[:200] + '...' if info.get('description') else ''
-                }
+            self._rate_limiter.acquire(urlparse(url).netloc)
+            ydl = self._get_ydl('info', ydl_opts)
+            info = ydl.extract_info(url, download=False)
+            with self._info_lock:
+                while len(self._info_cache) >= self._INFO_CACHE_MAX:
+                    del self._info_cache[next(iter(self._info_cache))]
+                self._info_cache[url] = (time.monotonic() + self._INFO_CACHE_TTL, info)
+            return info
         except Exception as e:
-            self.logger.error(f"Failed to extract video info: {str(e)}")
+            self.logger.error("Failed to extract video info: %s", e)
+            return None
+
+    def get_video_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract video information without downloading.
+
+        Args:
+            url: Video URL
+
+        Returns:
+            Dictionary containing video information or None if failed
+        """
+        info = self._extract_info(url)
+        if info is None:
             return None
+
+        # Descriptions can run to tens of KB; look the field up once and
+        # only build a new string when it actually needs truncating.
+        desc = info.get('description') or ''
+        if len(desc) > 200:
+            desc = desc[:200] + '...'
+
+        return {
+            'title': info.get('title', 'Unknown'),
+            'duration': info.get('duration', 0),
+            'uploader': info.get('uploader', 'Unknown'),
+            'view_count': info.get('view_count', 0),
+            'upload_date': info.get('upload_date', 'Unknown'),
+            'formats': len(info.get('formats', [])),
+            'thumbnail': info.get('thumbnail', ''),
+            'description': desc
+        }
     
-    def get_download_options(self, url: str, audio_only: bool = False, 
+    def get_video_info_bulk(self, urls: list) -> list:
+        """
+        Extract info for many URLs concurrently.
+
+        Metadata extraction is network-bound and releases the GIL on
+        socket waits, so the per-URL round-trips overlap cleanly.
+
+        Args:
+            urls: Video URLs
+
+        Returns:
+            List of info summaries in input order (None per failed URL)
+        """
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(32, len(urls))) as executor:
+            return list(executor.map(self.get_video_info, urls))
+
+    def get_download_options(self, url: str, audio_only: bool = False,
                            subtitle_langs: Optional[list] = None) -> Dict[str, Any]:
         """
         Get yt-dlp download options.
@@ -97,27 +348,50 @@ class VideoDownloader:
         Returns:
             Dictionary of yt-dlp options
         """
-        # Create safe filename template
-        filename_template = str(self.output_dir / "%(title)s.%(ext)s")
-        
         ydl_opts = {
-            'outtmpl': filename_template,
+            'outtmpl': self._filename_template,
             'format': 'bestaudio/best' if audio_only else self.quality,
-            'writesubtitles': bool(subtitle_langs),
-            'writeautomaticsub': bool(subtitle_langs),
-            'subtitleslangs': subtitle_langs or [],
             'ignoreerrors': False,
             'no_warnings': False,
+            # Fetch HLS/DASH fragments in parallel and pull plain HTTP
+            # sources via 10 MB range requests so one video can
+            # saturate the link instead of serializing fragment fetches
+            'concurrent_fragment_downloads': self.concurrent_fragments,
+            'http_chunk_size': 10 * 1024 * 1024,
+            # 1 MiB write buffer: on fast links the default small chunks
+            # turn the disk path into a syscall-per-chunk bottleneck
+            'buffersize': 1 << 20,
         }
-        
+
+        # The common path requests no subtitles; leaving the keys out
+        # entirely keeps yt-dlp's subtitle machinery switched off
+        # instead of evaluating an empty language list per download
+        if subtitle_langs:
+            ydl_opts.update(
+                writesubtitles=True,
+                writeautomaticsub=True,
+                subtitleslangs=subtitle_langs,
+            )
+
         # Additional options for better compatibility
         if not audio_only:
             ydl_opts.update({
-                'merge_output_format': 'mp4',
-                'writeinfojson': True,
+                # With orjson available the info.json is written by the
+                # OrjsonInfoJsonPP postprocessor instead of yt-dlp's
+                # stdlib-json path (see _attach_fast_infojson)
+                'writeinfojson': orjson is None,
                 'writethumbnail': True,
             })
-        
+            # Forcing mp4 output makes ffmpeg re-read and re-write the
+            # whole file; when the cached extraction shows the pick is
+            # already a single-stream mp4 there is nothing to remux, so
+            # only request the container when merging is actually needed.
+            cached = self._peek_info(url)
+            if not (cached is not None
+                    and cached.get('ext') == 'mp4'
+                    and not cached.get('requested_formats')):
+                ydl_opts['merge_output_format'] = 'mp4'
+
         return ydl_opts
     
     def download_video(self, url: str, audio_only: bool = False, 
@@ -135,63 +409,169 @@ class VideoDownloader:
         """
         try:
             # Validate URL
-            parsed_url = urlparse(url)
-            if not parsed_url.scheme or not parsed_url.netloc:
+            url_match = _URL_RE.match(url)
+            if url_match is None:
                 raise ValueError("Invalid URL format")
             
-            self.logger.info(f"Starting download from: {url}")
+            self.logger.info("Starting download from: %s", url)
             
-            # Get video info first
-            info = self.get_video_info(url)
+            # Get video info first (cached for the download step below)
+            info = self._extract_info(url)
             if info:
-                self.logger.info(f"Video: {info['title']}")
-                self.logger.info(f"Uploader: {info['uploader']}")
-                self.logger.info(f"Duration: {info['duration']} seconds")
+                self.logger.info("Video: %s", info.get('title', 'Unknown'))
+                self.logger.info("Uploader: %s", info.get('uploader', 'Unknown'))
+                self.logger.info("Duration: %s seconds", info.get('duration', 0))
             
             # Download options
             ydl_opts = self.get_download_options(url, audio_only, subtitle_langs)
-            
-            # Download the video
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+
+            # Download the video, reusing the cached extraction instead
+            # of letting yt-dlp re-extract the same URL
+            self._rate_limiter.acquire(url_match.group(1))
+            # Download opts are URL-dependent (the container passthrough
+            # keys off this URL's cached info), so no pooling here - a
+            # reused instance would replay the previous URL's options
+            ydl = _ytdlp().YoutubeDL(ydl_opts)
+            if not audio_only:
+                self._attach_fast_infojson(ydl)
+            if info is not None:
+                ydl.process_ie_result(dict(info), download=True)
+            else:
                 ydl.download([url])
             
-            self.logger.info(f"Successfully downloaded: {url}")
+            self.logger.info("Successfully downloaded: %s", url)
             return True
             
-        except yt_dlp.DownloadError as e:
-            self.logger.error(f"Download error: {str(e)}")
+        except _ytdlp().DownloadError as e:
+            self.logger.error("Download error: %s", e)
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
+            self.logger.error("Unexpected error: %s", e)
             return False
     
-    def download_playlist(self, url: str, max_downloads: Optional[int] = None) -> bool:
+    def _attach_fast_infojson(self, ydl) -> None:
+        """Register the orjson info-json writer on `ydl` once, if available."""
+        if orjson is None or getattr(ydl, '_fast_infojson', False):
+            return
+        ydl.add_post_processor(_orjson_infojson_pp()(), when='after_move')
+        ydl._fast_infojson = True
+
+    def _pp_hook(self, d: Dict[str, Any]) -> None:
+        """Serialize post-processing so only one ffmpeg runs at a time."""
+        status = d.get('status')
+        if status == 'started':
+            self._pp_gate.acquire()
+            self._pp_state.holds_gate = True
+        elif status == 'finished':
+            self._pp_state.holds_gate = False
+            self._pp_gate.release()
+
+    def _download_one(self, url: str) -> None:
         """
-        Download entire playlist or channel.
-        
+        Blocking download of a single playlist entry (runs on a worker
+        thread). Downloads proceed at full pool width; the attached
+        post-processing hook makes merges take turns, pipelining item
+        N+1's download against item N's ffmpeg work.
+
+        Args:
+            url: Entry URL
+        """
+        self._rate_limiter.acquire(urlparse(url).netloc)
+        ydl_opts = self.get_download_options(url)
+        ydl_opts['postprocessor_hooks'] = [self._pp_hook]
+        # Interleaved progress bars from N workers are unreadable and
+        # the per-chunk formatting isn't free under concurrency
+        ydl_opts['noprogress'] = True
+        try:
+            ydl = _ytdlp().YoutubeDL(ydl_opts)
+            self._attach_fast_infojson(ydl)
+            ydl.download([url])
+        finally:
+            # A post-processing failure can abort between the hook's
+            # 'started' and 'finished' - don't let it strand the gate.
+            if getattr(self._pp_state, 'holds_gate', False):
+                self._pp_state.holds_gate = False
+                self._pp_gate.release()
+
+    async def _download_entry(self, url: str, sem: asyncio.Semaphore,
+                              loop, executor) -> bool:
+        """
+        Download one playlist entry without blocking the event loop.
+
+        Args:
+            url: Entry URL
+            sem: Semaphore bounding concurrent downloads
+            loop: Running event loop
+            executor: Thread pool running the blocking yt-dlp calls
+
+        Returns:
+            True if the entry downloaded successfully
+        """
+        async with sem:
+            try:
+                await loop.run_in_executor(executor, self._download_one, url)
+                return True
+            except Exception as e:
+                self.logger.error("Failed to download playlist entry %s: %s", url, e)
+                return False
+
+    def download_playlist(self, url: str, max_downloads: Optional[int] = None,
+                          workers: int = 4) -> bool:
+        """
+        Download entire playlist or channel with concurrent entries.
+
+        Entries are enumerated with a flat extraction first, then fanned
+        out to `workers` parallel downloads so slow per-item hosts don't
+        leave the pipe idle.
+
         Args:
             url: Playlist/Channel URL
             max_downloads: Maximum number of videos to download
-            
+            workers: Number of entries to download in parallel
+
         Returns:
-            True if download successful, False otherwise
+            True if all downloads successful, False otherwise
         """
         try:
-            ydl_opts = self.get_download_options(url)
-            
+            self.logger.info("Starting playlist download from: %s", url)
+
+            # 'in_playlist' keeps enumeration to the single playlist
+            # page fetch - entries only get fully extracted when their
+            # download actually runs, so capped runs never pay metadata
+            # round-trips for entries that are sliced away
+            enum_opts = {'extract_flat': 'in_playlist', 'quiet': True, 'no_warnings': True}
             if max_downloads:
-                ydl_opts['playlistend'] = max_downloads
-            
-            self.logger.info(f"Starting playlist download from: {url}")
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-            
-            self.logger.info(f"Successfully downloaded playlist: {url}")
-            return True
-            
+                enum_opts['playlistend'] = max_downloads
+
+            self._rate_limiter.acquire(urlparse(url).netloc)
+            ydl = self._get_ydl(f"enum:{max_downloads or 0}", enum_opts)
+            info = ydl.extract_info(url, download=False)
+
+            entries = [e for e in (info.get('entries') or []) if e and e.get('url')]
+            if max_downloads:
+                entries = entries[:max_downloads]
+
+            if not entries:
+                # Not a playlist (or empty enumeration) - single download
+                return self.download_video(url)
+
+            async def _run() -> list:
+                loop = asyncio.get_running_loop()
+                sem = asyncio.Semaphore(workers)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    return await asyncio.gather(*[
+                        self._download_entry(e['url'], sem, loop, executor)
+                        for e in entries
+                    ])
+
+            results = asyncio.run(_run())
+            succeeded = sum(results)
+
+            self.logger.info("Playlist download finished: %d/%d entries from %s", succeeded, len(results), url)
+            return succeeded == len(results)
+
         except Exception as e:
-            self.logger.error(f"Playlist download error: {str(e)}")
+            self.logger.error("Playlist download error: %s", e)
             return False
     
     def get_available_formats(self, url: str) -> Optional[list]:
@@ -204,42 +584,34 @@ class VideoDownloader:
         Returns:
             List of available formats or None if failed
         """
-        try:
-            with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
-                info = ydl.extract_info(url, download=False)
-                formats = info.get('formats', [])
-                
-                format_list = []
-                for fmt in formats:
-                    format_info = {
-                        'format_id': fmt.get('format_id'),
-                        'ext': fmt.get('ext'),
-                        'resolution': fmt.get('resolution'),
-                        'filesize': fmt.get('filesize'),
-                        'fps': fmt.get('fps'),
-                        'vcodec': fmt.get('vcodec'),
-                        'acodec': fmt.get('acodec'),
-                    }
-                    format_list.append(format_info)
-                
-                return format_list
-                
-        except Exception as e:
-            self.logger.error(f"Failed to get formats: {str(e)}")
+        info = self._extract_info(url)
+        if info is None:
             return None
 
+        # Single comprehension over a fixed key tuple; videos routinely
+        # expose dozens to hundreds of formats, so the per-row loop
+        # overhead adds up.
+        keys = self._FORMAT_KEYS
+        return [{k: fmt.get(k) for k in keys} for fmt in info.get('formats', [])]
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_available() -> bool:
+    """Whether an ffmpeg binary is on PATH (checked once per process)."""
+    return shutil.which('ffmpeg') is not None
+
 
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not _ffmpeg_available():
         print("Warning: FFmpeg not found. Some format conversions may not work.")
         print("Install FFmpeg from: https://ffmpeg.org/download.html")
 
 
 def main():
     """Main function with command-line interface."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Professional video downloader supporting multiple platforms",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -253,7 +625,9 @@ Examples:
         """
     )
     
-    parser.add_argument('url', help='Video URL to download')
+    parser.add_argument('url', nargs='?', help='Video URL to download')
+    parser.add_argument('--batch', metavar='FILE',
+                       help='File with one URL per line; fetches info for all of them concurrently')
     parser.add_argument('-o', '--output', default='downloads', 
                        help='Output directory (default: downloads)')
     parser.add_argument('-q', '--quality', default='best',
@@ -266,19 +640,41 @@ Examples:
                        help='Maximum number of videos to download from playlist')
     parser.add_argument('--subtitles', nargs='+',
                        help='Subtitle languages to download (e.g., en es fr)')
+    parser.add_argument('--concurrent-fragments', type=int, default=8,
+                       help='Parallel fragment downloads for HLS/DASH sources (default: 8)')
+    parser.add_argument('--rate-limit', type=float, default=0.0,
+                       help='Requests per second allowed per host (default: unlimited)')
     parser.add_argument('--info-only', action='store_true',
                        help='Show video information only, do not download')
     parser.add_argument('--formats', action='store_true',
                        help='List available formats for the video')
     
     args = parser.parse_args()
-    
+
+    if not args.url and not args.batch:
+        parser.error('a URL (or --batch FILE) is required')
+
     # Check dependencies
     check_dependencies()
-    
+
     # Initialize downloader
-    downloader = VideoDownloader(args.output, args.quality)
-    
+    downloader = VideoDownloader(args.output, args.quality, args.concurrent_fragments,
+                                 rate_limit=args.rate_limit)
+
+    if args.batch:
+        with open(args.batch) as f:
+            urls = [line.strip() for line in f if line.strip()]
+        for url, info in zip(urls, downloader.get_video_info_bulk(urls)):
+            print("\n" + "="*50)
+            print(url)
+            print("="*50)
+            if info:
+                for key, value in info.items():
+                    print(f"{key.replace('_', ' ').title()}: {value}")
+            else:
+                print("Failed to retrieve video information")
+        return
+
     if args.info_only:
         info = downloader.get_video_info(args.url)
         if info:
@@ -299,9 +695,17 @@ Examples:
             print("="*80)
             print(f"{'ID':<10} {'Extension':<10} {'Resolution':<12} {'FPS':<5} {'Video Codec':<12} {'Audio Codec':<12}")
             print("-"*80)
-            for fmt in formats:
-                print(f"{fmt['format_id']:<10} {fmt['ext']:<10} {fmt['resolution'] or 'N/A':<12} "
-                      f"{fmt['fps'] or 'N/A':<5} {fmt['vcodec'] or 'N/A':<12} {fmt['acodec'] or 'N/A':<12}")
+            # One template applied per row and a single write for the
+            # whole table - videos can expose hundreds of formats, and
+            # per-row print calls flush line by line
+            row_tmpl = ("{format_id:<10} {ext:<10} {resolution:<12} "
+                        "{fps:<5} {vcodec:<12} {acodec:<12}")
+            rows = [
+                row_tmpl.format_map(
+                    {k: 'N/A' if v is None else v for k, v in fmt.items()})
+                for fmt in formats
+            ]
+            sys.stdout.write("\n".join(rows) + "\n")
         else:
             print("Failed to retrieve format information")
         return